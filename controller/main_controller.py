@@ -1,16 +1,36 @@
 # controller/main_controller.py
 
+import os
+import sys
 from pathlib import Path
 from PySide6.QtWidgets import QFileDialog
 from model.report import TestReport
 from model.session import SessionManager
-from view.widgets import MainWindow
-from reports.pdf_builder import build_pdf
+from model.workspace import Workspace, remove_stale_workspaces
+from view.widgets import MainWindow, cfg
+from reports.pdf_builder import build_pdf, build_pdf_preview, build_pdf_streaming, remove_stale_volumes
+from reports.pdf_config import STREAMING_MIN_ROWS, VOLUME_MAX_PAGES
+
+
+def _user_cache_dir() -> Path:
+    if sys.platform == 'win32':
+        base = Path(os.environ.get('LOCALAPPDATA') or Path.home() / "AppData" / "Local")
+    elif sys.platform == 'darwin':
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / ".cache")
+    return base / "test_dashboard"
 
 class MainController:
     # Point at ~/.config/session.json
     CONFIG_DIR = Path.home() / ".config" / "test_dashboard"
-    SESSION_FILE = CONFIG_DIR / "test_dashboard_session.json"
+    SESSION_FILE = CONFIG_DIR / "test_dashboard_session.snapshot"
+    # JSON session written by earlier versions, opened if no snapshot exists yet
+    LEGACY_SESSION_FILE = CONFIG_DIR / "test_dashboard_session.json"
+    # Inactive reports beyond the memory budget are spilled here
+    CACHE_DIR = _user_cache_dir()
+    # where earlier versions spilled them; only stale leftovers are removed
+    LEGACY_CACHE_DIR = CONFIG_DIR / "cache"
 
     def __init__(self, app):
         self.app = app
@@ -18,11 +38,16 @@ class MainController:
         self.CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
         self.report = TestReport()
-        self.session = SessionManager(self.SESSION_FILE)
+        self.session = SessionManager(self.SESSION_FILE, self.LEGACY_SESSION_FILE)
+        budget_mb = cfg.get('workspace', {}).get('memory_budget_mb', 512)
+        remove_stale_workspaces(self.LEGACY_CACHE_DIR)
+        self.workspace = Workspace(self.CACHE_DIR, budget_mb * 1024 * 1024,
+                                   on_error=self.spill_failed)
+        self.app.aboutToQuit.connect(self.workspace.clear)
         self.window = MainWindow(self)
 
         # Try loading last session if exists
-        if self.SESSION_FILE.exists():
+        if self.session.exists():
             self.load_session()
 
     def show(self):
@@ -36,13 +61,42 @@ class MainController:
         if not path:
             return
         try:
-            self.report.load_from_excel(path)
-            summary = self.report.summary()
-            self.window.update_view(self.report.df, summary)
-            self.window.set_feedback(f"Loaded {len(self.report.df)} rows from Excel.")
+            report = TestReport()
+            report.load_from_excel(path)
+            # each workbook opens in its own tab with an empty form;
+            # switching to it updates the view
+            self.open_report(Path(path).stem, report)
+            self.window.set_feedback(f"Loaded {len(report.df)} rows from Excel.")
         except Exception as e:
             self.window.show_error(str(e))
 
+    def open_report(self, name, report, metadata=None):
+        name = self.workspace.add(name, report, metadata)
+        self.window.add_tab(name)
+
+    def switch_report(self, index):
+        # Remember the form contents of the tab we are leaving
+        if self.workspace.active is not None:
+            self.workspace.set_metadata(self.workspace.active, self.window.get_metadata())
+        if index < 0:
+            self.workspace.active = None
+            self.report = TestReport()
+            self.window.update_view(self.report.frame, self.report.summary())
+            return
+        name = self.workspace.names()[index]
+        self.report = self.workspace.activate(name)
+        self.window.set_metadata(self.workspace.metadata(name))
+        self.window.update_view(self.report.frame, self.report.summary(),
+                                self.report.sort_cache)
+
+    def spill_failed(self, name, error):
+        self.window.show_error(f"Could not move '{name}' to disk, it stays in memory: {error}")
+
+    def close_report(self, index):
+        name = self.workspace.names()[index]
+        self.workspace.close(name)
+        self.window.remove_tab(index)
+
     def save_session(self):
         metadata = self.window.get_metadata()
         try:
@@ -56,9 +110,7 @@ class MainController:
     def load_session(self):
         try:
             report, metadata = self.session.load()
-            self.report = report
-            self.window.set_metadata(metadata)
-            self.window.update_view(self.report.df, report.summary())
+            self.open_report(metadata.get('pdf_name') or "Session", report, metadata)
             self.window.set_feedback("Session loaded.")
         except Exception:
             pass
@@ -81,7 +133,26 @@ class MainController:
             # Update metadata with counts
             summary = self.report.summary()
             metadata.update(summary)
-            build_pdf(path, self.report.df, metadata, pie_bytes)
-            self.window.set_feedback(f"PDF saved: {path}")
+            if len(self.report.frame) >= STREAMING_MIN_ROWS:
+                # large reports: table generated lazily, split into volumes
+                paths = build_pdf_streaming(path, self.report.frame, metadata, pie_bytes,
+                                            VOLUME_MAX_PAGES)
+            else:
+                build_pdf(path, self.report.to_dataframe(), metadata, pie_bytes)
+                paths = [path]
+                remove_stale_volumes(path, paths)
+            self.window.set_feedback(f"PDF saved: {', '.join(paths)}")
+        except Exception as e:
+            self.window.show_error(str(e))
+
+    def preview_pdf(self):
+        metadata = self.window.get_metadata()
+        try:
+            # Draft build: no images or pie chart, only the first table pages
+            metadata.update(self.report.summary())
+            # the frame is passed as-is, so snapshot-backed reports decode only the rows shown
+            pdf_bytes = build_pdf_preview(self.report.frame, metadata)
+            self.window.show_pdf_preview(pdf_bytes)
+            self.window.set_feedback("Draft preview updated.")
         except Exception as e:
             self.window.show_error(str(e))
\ No newline at end of file
@@ -4,6 +4,8 @@ from enum import Enum
 from io import BytesIO
 import matplotlib.pyplot as plt
 
+from .sorting import SortCache
+
 
 class TestStatus(Enum):
     PASS = "Pass"
@@ -14,13 +16,61 @@ class TestStatus(Enum):
 class TestReport:
     """
     Model for test report data: holds DataFrame and provides stats & I/O methods.
+    A report opened from a snapshot keeps the memory-mapped SnapshotFrame
+    instead; it has no `df`, and to_dataframe() decodes a copy.
     """
     def __init__(self, records=None):
+        self.sort_cache = SortCache()
         # Initialize DataFrame with correct columns
         self.df = pd.DataFrame(records or [], columns=[
             'Test Case ID', 'Test Case Description', 'Test Status', 'Comments'
         ])
 
+    @classmethod
+    def from_snapshot(cls, snapshot) -> 'TestReport':
+        report = cls()
+        report.snapshot = snapshot
+        return report
+
+    @property
+    def df(self) -> pd.DataFrame:
+        if self.snapshot is not None:
+            # a decoded copy would quietly drop any change made through it
+            raise AttributeError("A snapshot-backed report has no DataFrame; "
+                                 "use frame, column() or to_dataframe()")
+        return self._df
+
+    @df.setter
+    def df(self, value: pd.DataFrame) -> None:
+        self._df = value
+        self.snapshot = None
+        self.sort_cache.clear()
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        The report as a DataFrame. A snapshot-backed report is decoded into
+        a new DataFrame on every call; changes to it are not kept.
+        """
+        if self.snapshot is not None:
+            return self.snapshot.to_dataframe()
+        return self._df
+
+    @property
+    def frame(self):
+        """What the table displays: the DataFrame, or the lazy snapshot."""
+        return self.snapshot if self.snapshot is not None else self._df
+
+    def column(self, name: str) -> pd.Series:
+        if self.snapshot is not None:
+            return self.snapshot.column(self.snapshot.columns.get_loc(name))
+        return self._df[name]
+
+    def memory_usage(self) -> int:
+        """Approximate bytes held in memory (mapped snapshot pages excluded)."""
+        if self.snapshot is not None:
+            return 0
+        return int(self._df.memory_usage(deep=True).sum())
+
     def load_from_excel(self, path: str) -> None:
         # Load Excel into DataFrame
         df = pd.read_excel(path)
@@ -54,11 +104,12 @@ class TestReport:
         """
         Returns dict with total count, counts per status, and percentages.
         """
-        total = len(self.df)
+        status = self.column('Test Status')
+        total = len(status)
         counts = {
-            TestStatus.PASS.value: int((self.df['Test Status'] == TestStatus.PASS.value).sum()),
-            TestStatus.FAIL.value: int((self.df['Test Status'] == TestStatus.FAIL.value).sum()),
-            TestStatus.NOT_TESTED.value: int((self.df['Test Status'] == TestStatus.NOT_TESTED.value).sum()),
+            TestStatus.PASS.value: int((status == TestStatus.PASS.value).sum()),
+            TestStatus.FAIL.value: int((status == TestStatus.FAIL.value).sum()),
+            TestStatus.NOT_TESTED.value: int((status == TestStatus.NOT_TESTED.value).sum()),
         }
         percentages = {
             status: f"{(count/total*100):.1f}%" if total else "0.0%"
@@ -1,28 +1,55 @@
 # model/session.py
 import json
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
 
 from .report import TestReport
+from .snapshot import is_snapshot, open_snapshot, write_snapshot
 
 
 class SessionManager:
-    """Handles saving and loading user sessions to a JSON file."""
-    def __init__(self, path: Path):
+    """
+    Handles saving and loading user sessions. Sessions are written as binary
+    columnar snapshots (see model/snapshot.py) unless the path ends in .json;
+    loading detects the format, so older JSON sessions still open.
+    """
+    def __init__(self, path: Path, legacy_path: Optional[Path] = None):
         self.path = path
+        # read when `path` does not exist yet, e.g. a session from an older version
+        self.legacy_path = legacy_path
+
+    def exists(self) -> bool:
+        return self._source() is not None
 
     def save(self, report: TestReport, metadata: dict) -> None:
+        if self.path.suffix == '.json':
+            self._save_json(report, metadata)
+        else:
+            write_snapshot(self.path, report.frame, metadata)
+
+    def load(self) -> Tuple[TestReport, dict]:
+        path = self._source() or self.path
+        if is_snapshot(path):
+            # memory-mapped: rows are decoded only when the table asks for them
+            snapshot = open_snapshot(path)
+            return TestReport.from_snapshot(snapshot), dict(snapshot.metadata)
+        with open(path) as f:
+            data = json.load(f)
+        report = TestReport(data.get('df', []))
+        metadata = data.get('metadata', {})
+        return report, metadata
+
+    def _save_json(self, report: TestReport, metadata: dict) -> None:
         data = {
-            'df': report.df.to_dict(orient='records'),
+            'df': report.to_dataframe().to_dict(orient='records'),
             'metadata': metadata
         }
         self.path.parent.mkdir(parents=True, exist_ok=True)
         with open(self.path, 'w') as f:
             json.dump(data, f, indent=2)
 
-    def load(self) -> Tuple[TestReport, dict]:
-        with open(self.path) as f:
-            data = json.load(f)
-        report = TestReport(data.get('df', []))
-        metadata = data.get('metadata', {})
-        return report, metadata
\ No newline at end of file
+    def _source(self) -> Optional[Path]:
+        for path in (self.path, self.legacy_path):
+            if path is not None and path.exists():
+                return path
+        return None
\ No newline at end of file
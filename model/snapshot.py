@@ -0,0 +1,278 @@
+# model/snapshot.py
+"""
+Binary columnar snapshot of a report, opened through a memory map.
+
+Layout (all integers little-endian):
+
+    MAGIC (8 bytes) | header length (uint64) | JSON header | data sections
+
+The JSON header holds the row count, the session metadata and one entry per
+column; section offsets are relative to the first 8-byte boundary after the
+header. The status column is stored as fixed-width int8 codes into a label
+list (-1 = missing); every other column as uint64 offsets (rows + 1) into a
+UTF-8 heap, plus an optional uint8 null mask. Values are stored as text;
+missing values read back as NaN, as in a DataFrame.
+"""
+import json
+import mmap
+import os
+import threading
+import weakref
+from pathlib import Path
+from typing import Dict, Union
+
+import numpy as np
+import pandas as pd
+
+from .report import TestStatus
+from .sorting import natural_sort_key_utf8, sort_key
+
+MAGIC = b'TRSNAP\x00\x01'
+STATUS_COLUMN = 'Test Status'
+_ALIGN = 8
+
+# every open SnapshotFrame, so a file can be unmapped before it is replaced
+_frames: 'weakref.WeakSet[SnapshotFrame]' = weakref.WeakSet()
+_frames_lock = threading.Lock()
+
+
+def is_snapshot(path: Path) -> bool:
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def write_snapshot(path: Path, frame: Union[pd.DataFrame, 'SnapshotFrame'], metadata: dict) -> None:
+    """
+    Writes the columns of `frame` and `metadata`. The file is written next
+    to `path` and moved into place. Windows cannot replace a file that is
+    mapped, so frames reading `path` let go of it first: `frame` itself is
+    mapped again onto the new file (which now holds its edits), any other
+    frame keeps reading the old contents from an in-memory copy.
+    """
+    if isinstance(frame, SnapshotFrame):
+        columns = {name: frame.column(i) for i, name in enumerate(frame.columns)}
+    else:
+        columns = {name: frame[name] for name in frame.columns}
+    rows = len(frame)
+    entries, sections, pos = [], [], 0
+
+    def add(data: bytes) -> list:
+        nonlocal pos
+        sections.append((pos, data))
+        span = [pos, len(data)]
+        pos = _aligned(pos + len(data))
+        return span
+
+    for name, series in columns.items():
+        nulls = series.isna().to_numpy()
+        if name == STATUS_COLUMN:
+            codes, labels = _encode_status(series)
+            entries.append({'name': name, 'kind': 'codes', 'labels': labels,
+                            'codes': add(codes.tobytes())})
+            continue
+        encoded = [b'' if null else str(v).encode('utf-8')
+                   for v, null in zip(series.tolist(), nulls)]
+        offsets = np.zeros(rows + 1, dtype='<u8')
+        np.cumsum(np.fromiter(map(len, encoded), dtype='<u8', count=rows), out=offsets[1:])
+        entries.append({
+            'name': name, 'kind': 'strings',
+            'offsets': add(offsets.tobytes()),
+            'heap': add(b''.join(encoded)),
+            'nulls': add(nulls.astype(np.uint8).tobytes()) if nulls.any() else None,
+        })
+
+    header = json.dumps({'rows': rows, 'metadata': metadata, 'columns': entries}).encode('utf-8')
+    data_start = _aligned(len(MAGIC) + 8 + len(header))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(MAGIC)
+        f.write(np.uint64(len(header)).astype('<u8').tobytes())
+        f.write(header)
+        for offset, data in sections:
+            f.seek(data_start + offset)
+            f.write(data)
+        f.truncate(data_start + pos)
+
+    with _frames_lock:
+        mapped = [f for f in _frames if f.maps(path)]
+    remap = any(f is frame for f in mapped)
+    for other in mapped:
+        if other is frame:
+            other._unmap()
+        else:
+            other._detach()
+    try:
+        os.replace(tmp, path)
+    finally:
+        if remap:
+            frame._map()
+    if remap:
+        frame._edits.clear()
+
+
+def open_snapshot(path: Path) -> 'SnapshotFrame':
+    return SnapshotFrame(path)
+
+
+class SnapshotFrame:
+    """
+    Read-only view of a snapshot file that looks enough like a DataFrame
+    for the table model (`shape`, `columns`, `iat`). Cells are decoded only
+    when asked for; edits are kept in a small overlay on top of the file.
+    """
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._mm = None
+        self._edits: Dict[tuple, object] = {}
+        self.iat = _SnapshotIndexer(self)
+        self._map()
+        with _frames_lock:
+            _frames.add(self)
+
+    def _map(self) -> None:
+        with open(self.path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if mm[:len(MAGIC)] != MAGIC:
+            mm.close()
+            raise ValueError(f"Not a session snapshot: {self.path}")
+        header_len = int(np.frombuffer(mm, dtype='<u8', count=1, offset=len(MAGIC))[0])
+        start = len(MAGIC) + 8
+        header = json.loads(mm[start:start + header_len].decode('utf-8'))
+        self._mm = mm
+        self._base = _aligned(start + header_len)
+
+        self.metadata = header['metadata']
+        self._rows = header['rows']
+        self._entries = header['columns']
+        self.columns = pd.Index([e['name'] for e in self._entries])
+
+    def _unmap(self) -> None:
+        self._mm.close()
+
+    def _detach(self) -> None:
+        """Reads the whole file into memory and unmaps it."""
+        data = self._mm[:]
+        self._mm.close()
+        self._mm = data
+
+    def maps(self, path: Path) -> bool:
+        """True while this frame reads `path` through a memory map."""
+        if not isinstance(self._mm, mmap.mmap) or self._mm.closed:
+            return False
+        try:
+            return os.path.samefile(self.path, path)
+        except OSError:
+            return False
+
+    @property
+    def shape(self):
+        return (self._rows, len(self._entries))
+
+    def __len__(self):
+        return self._rows
+
+    @property
+    def modified(self) -> bool:
+        return bool(self._edits)
+
+    def value(self, row: int, col: int):
+        if (row, col) in self._edits:
+            return self._edits[(row, col)]
+        entry = self._entries[col]
+        if entry['kind'] == 'codes':
+            code = int(self._array(entry['codes'], np.int8)[row])
+            return np.nan if code < 0 else entry['labels'][code]
+        if entry['nulls'] is not None and self._array(entry['nulls'], np.uint8)[row]:
+            return np.nan
+        offsets = self._array(entry['offsets'], '<u8')
+        heap = self._base + entry['heap'][0]
+        return self._mm[heap + int(offsets[row]):heap + int(offsets[row + 1])].decode('utf-8')
+
+    def column(self, col: int) -> pd.Series:
+        """Decodes a whole column (the status column stays a cheap Categorical)."""
+        entry = self._entries[col]
+        if entry['kind'] == 'codes':
+            # copied, so no view into the mapping outlives this call
+            codes = self._array(entry['codes'], np.int8).copy()
+            values = pd.Series(pd.Categorical.from_codes(codes, categories=entry['labels']))
+        else:
+            offsets = self._array(entry['offsets'], '<u8').tolist()
+            start = self._base + entry['heap'][0]
+            heap = self._mm[start:start + entry['heap'][1]]
+            if heap.isascii():
+                # byte offsets are character offsets: decode once, then slice
+                heap = heap.decode('ascii')
+                values = [heap[a:b] for a, b in zip(offsets[:-1], offsets[1:])]
+            else:
+                values = [heap[a:b].decode('utf-8') for a, b in zip(offsets[:-1], offsets[1:])]
+            values = pd.Series(values, dtype=object)
+            if entry['nulls'] is not None:
+                values[self._array(entry['nulls'], np.uint8).astype(bool)] = np.nan
+        edits = {r: v for (r, c), v in self._edits.items() if c == col}
+        if edits:
+            values = values.astype(object)
+            values.iloc[list(edits)] = list(edits.values())
+        values.name = entry['name']
+        return values
+
+    def natural_sort_key(self, col: int) -> np.ndarray:
+        """sort_key(self.column(col), natural=True), ranked straight from the stored text."""
+        entry = self._entries[col]
+        if (entry['kind'] != 'strings' or entry['nulls'] is not None
+                or any(c == col for _, c in self._edits)):
+            return sort_key(self.column(col), natural=True)
+        return natural_sort_key_utf8(self._array(entry['heap'], np.uint8),
+                                     self._array(entry['offsets'], '<u8'))
+
+    def rows(self, start: int, stop: int) -> pd.DataFrame:
+        """Decodes just rows `start` to `stop` (exclusive)."""
+        rows = range(max(start, 0), min(stop, self._rows))
+        return pd.DataFrame({name: [self.value(r, c) for r in rows]
+                             for c, name in enumerate(self.columns)})
+
+    def head(self, n: int) -> pd.DataFrame:
+        return self.rows(0, n)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        df = pd.DataFrame({name: self.column(i) for i, name in enumerate(self.columns)})
+        if STATUS_COLUMN in df.columns:
+            df[STATUS_COLUMN] = df[STATUS_COLUMN].astype(object)
+        return df
+
+    def _array(self, span, dtype) -> np.ndarray:
+        # zero-copy view into the mapping; pages are read in as they are touched
+        offset, size = span
+        dtype = np.dtype(dtype)
+        return np.frombuffer(self._mm, dtype=dtype, count=size // dtype.itemsize,
+                             offset=self._base + offset)
+
+
+class _SnapshotIndexer:
+    """`frame.iat[row, col]` access for SnapshotFrame."""
+    def __init__(self, frame: SnapshotFrame):
+        self._frame = frame
+
+    def __getitem__(self, key):
+        row, col = key
+        return self._frame.value(int(row), int(col))
+
+    def __setitem__(self, key, value):
+        row, col = key
+        self._frame._edits[(int(row), int(col))] = value
+
+
+def _encode_status(series: pd.Series):
+    labels = [s.value for s in TestStatus]
+    extra = sorted({str(v) for v in series.dropna().unique()} - set(labels))
+    labels += extra
+    if len(labels) > np.iinfo(np.int8).max:
+        raise ValueError(f"Too many distinct values in '{STATUS_COLUMN}' for a snapshot")
+    codes = pd.Categorical(series.astype(object).where(series.isna(), series.astype(str)),
+                           categories=labels).codes.astype(np.int8)
+    return codes, labels
+
+
+def _aligned(n: int) -> int:
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
@@ -0,0 +1,260 @@
+# model/sorting.py
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# Columns compared in natural order, so that TC_2 sorts before TC_10
+NATURAL_SORT_COLUMNS = ('Test Case ID',)
+
+# Characters copied at a time when gathering the tokens of natural keys
+TOKEN_WINDOW = 16
+
+# Numbers with up to this many digits are compared as 64-bit integers
+MAX_INT_DIGITS = 19
+
+# Above this many characters (distinct values x longest value), ranks are
+# computed with Python's sort instead of a fixed-width code point matrix
+FIXED_WIDTH_LIMIT = 32_000_000
+
+
+class SortCache:
+    """
+    Sort keys and single-column orders of one report. It lives with the
+    report, so switching tabs keeps it; only an edited column's entries
+    are dropped.
+    """
+    def __init__(self):
+        self.keys: Dict[int, np.ndarray] = {}                 # column -> dense key from sort_key()
+        self.orders: Dict[Tuple[int, bool], np.ndarray] = {}  # (column, ascending) -> order by that column alone
+
+    def invalidate(self, column: int) -> None:
+        self.keys.pop(column, None)
+        self.orders.pop((column, True), None)
+        self.orders.pop((column, False), None)
+
+    def clear(self) -> None:
+        self.keys.clear()
+        self.orders.clear()
+
+
+def sort_key(series: pd.Series, natural: bool = False) -> np.ndarray:
+    """
+    Returns the dense rank of each value of `series` in the order the table
+    displays it, so sorting never has to touch the strings again once the
+    key is cached.
+    """
+    if natural:
+        # Test case IDs are mostly distinct, so they are keyed row by row
+        # rather than paying for a hash of every value first
+        return _natural_ranks(np.asarray(series.array, dtype=object))
+    codes, uniques = pd.factorize(series.astype(str).fillna(''))
+    return _ranks(np.asarray(uniques, dtype=object))[codes]
+
+
+def natural_sort_key_utf8(heap: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    sort_key(..., natural=True) of text stored as UTF-8 bytes end to end
+    (row i is heap[offsets[i]:offsets[i + 1]]), such as a snapshot column,
+    without decoding it: UTF-8 bytes compare like the code points they spell.
+    """
+    flat = np.zeros(len(heap) + TOKEN_WINDOW, dtype=np.uint8)
+    flat[:len(heap)] = heap
+    return _natural_ranks_flat(flat, np.asarray(offsets, dtype=np.int64))
+
+
+def sort_permutation(key: np.ndarray, ascending: bool = True,
+                     order: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Stable argsort of the rows by `key` (from sort_key). With `order`, a
+    permutation already sorted by less significant columns, rows that tie
+    on `key` keep their place in it; otherwise ties keep their row order.
+    """
+    n = len(key)
+    if not ascending:
+        key = key.max(initial=0) - key
+    if is_distinct(key):
+        # every rank is taken once: each row's rank is its place
+        permutation = np.empty(n, dtype=np.int64)
+        permutation[key] = np.arange(n)
+        return permutation
+    if order is None:
+        order = np.arange(n)
+    # Ranks are below n, so (rank, position) packs into one distinct integer
+    # and an unstable quicksort gives the stable order
+    return order[np.argsort(key[order] * n + np.arange(n))]
+
+
+def is_distinct(key: np.ndarray) -> bool:
+    """True if no two rows tie on `key`, so less significant columns never matter."""
+    return len(key) == 0 or int(key.max()) == len(key) - 1
+
+
+def _ranks(values: np.ndarray) -> np.ndarray:
+    width = max(map(len, values), default=0) or 1
+    if len(values) * width <= FIXED_WIDTH_LIMIT:
+        text = values.astype(f'<U{width}')
+        return _row_ranks([text.view(np.uint32).reshape(len(text), width)])
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = np.empty(len(values), dtype=np.int64)
+    ranks[order] = np.arange(len(values))
+    return ranks
+
+
+def _natural_ranks(values: np.ndarray) -> np.ndarray:
+    """
+    Dense ranks in natural order. Each value is split into tokens, runs of
+    digits and runs of other characters, and the rows are ranked token by
+    token: the first tokens, then ties broken by the second, and so on.
+    IDs usually differ by the first number already, so the rest of the
+    text is never looked at. Numbers compare by value (digit count without
+    leading zeros, then digits) and before text; a value that runs out of
+    tokens sorts first ('TC_1_2' < 'TC_1_10' < 'TC_1_10a').
+    """
+    # str() of each value, as displayed (missing values read 'nan'/'None'),
+    # laid end to end so no row is padded to the longest
+    text = values.tolist()
+    try:
+        joined = ''.join(text)
+    except TypeError:
+        text = list(map(str, text))
+        joined = ''.join(text)
+    joined += '\0' * TOKEN_WINDOW
+    try:
+        flat = np.frombuffer(joined.encode('latin-1'), dtype=np.uint8)
+    except UnicodeEncodeError:
+        flat = np.frombuffer(joined.encode('utf-32-le'), dtype=np.uint32)
+    offsets = np.zeros(len(text) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, text), dtype=np.int64, count=len(text)), out=offsets[1:])
+    return _natural_ranks_flat(flat, offsets)
+
+
+def _natural_ranks_flat(flat: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    _natural_ranks of rows laid end to end in `flat` (row i is
+    flat[offsets[i]:offsets[i + 1]]), which ends in TOKEN_WINDOW zeros.
+    """
+    n = len(offsets) - 1
+    windows = np.lib.stride_tricks.sliding_window_view(flat, TOKEN_WINDOW)
+
+    # tokens begin at each row and where a run of digits starts or ends;
+    # every row's end is the beginning of the next row (or of the padding)
+    digit = _is_digit(flat)
+    begins = np.empty(len(flat), dtype=bool)
+    np.not_equal(digit[1:], digit[:-1], out=begins[1:])
+    begins[offsets] = begins[0] = True
+    boundaries = np.flatnonzero(begins)
+
+    # index into `boundaries` of the next token of each row
+    token = np.searchsorted(boundaries, offsets[:-1])
+    ranks = np.zeros(n, dtype=np.int64)
+    while not is_distinct(ranks):
+        has = np.flatnonzero(boundaries[token] < offsets[1:])
+        if not len(has):
+            break
+        begin, end = boundaries[token[has]], boundaries[token[has] + 1]
+        following = np.zeros(n, dtype=np.int64)
+        following[has] = _token_ranks(windows, begin, end - begin, digit[begin]) + 1
+        if ranks.any():
+            ranks = _dense_ranks(ranks * (int(following.max()) + 1) + following)
+        else:
+            # nothing to break ties of yet; `following` is dense apart from
+            # 0 when every row has a token
+            ranks = following - (len(has) == n)
+        token[has] += 1
+    return ranks
+
+
+def _is_digit(codes: np.ndarray) -> np.ndarray:
+    return (codes >= ord('0')) & (codes <= ord('9'))
+
+
+def _token_ranks(windows: np.ndarray, start: np.ndarray, length: np.ndarray,
+                 number: np.ndarray) -> np.ndarray:
+    """
+    Dense ranks of the tokens at `start`/`length`, numbers (by value) before
+    text (code by code).
+    """
+    ranks = np.empty(len(start), dtype=np.int64)
+    if number.any():
+        ranks[number] = _number_ranks(_gather(windows, start[number], length[number]),
+                                      length[number])
+    text = ~number
+    if text.any():
+        offset = int(ranks[number].max()) + 1 if number.any() else 0
+        ranks[text] = _row_ranks([_gather(windows, start[text], length[text])]) + offset
+    return ranks
+
+
+def _number_ranks(digits: np.ndarray, length: np.ndarray) -> np.ndarray:
+    """Dense ranks of the numbers spelled by rows of `digits` (`length` of each)."""
+    width = digits.shape[1]
+    if width <= MAX_INT_DIGITS:
+        values = np.zeros(len(digits), dtype=np.uint64)
+        for j in range(width):
+            values = np.where(j < length, values * 10 + (digits[:, j] - ord('0')), values)
+        return _dense_ranks(values)
+    # too long for an integer: significant digit count, then the digits
+    # ('000' keeps its last digit, 0)
+    zeros = np.minimum(np.argmax(digits != ord('0'), axis=1), length - 1)
+    cols = np.arange(width)
+    codes = np.empty((len(digits), width + 1), dtype=digits.dtype)
+    codes[:, 0] = length - zeros
+    codes[:, 1:] = np.take_along_axis(digits, np.minimum(zeros[:, None] + cols, width - 1), axis=1)
+    codes[:, 1:][cols >= (length - zeros)[:, None]] = 0
+    return _row_ranks([codes])
+
+
+def _gather(windows: np.ndarray, start: np.ndarray, length: np.ndarray,
+            width: Optional[int] = None) -> np.ndarray:
+    """Rows of `length` codes from each `start`, padded with 0 to a common width."""
+    if width is None:
+        width = int(length.max(initial=0))
+    step, last = windows.shape[1], len(windows) - 1
+    codes = np.concatenate([windows[np.minimum(start + j, last)]
+                            for j in range(0, max(width, 1), step)], axis=1)[:, :width]
+    codes[np.arange(width) >= length[:, None]] = 0
+    return codes
+
+
+def _row_ranks(parts: Sequence[np.ndarray]) -> np.ndarray:
+    """
+    Dense ranks of the rows of code matrices stacked in `parts` (possibly of
+    different widths; missing columns count as 0), comparing rows code by
+    code. Codes are packed into 64-bit words and ranked word by word, which
+    is far cheaper than sorting the rows as strings.
+    """
+    n = sum(len(p) for p in parts)
+    width = max((p.shape[1] for p in parts), default=1) or 1
+    top = max((int(p.max(initial=0)) for p in parts), default=0)
+    bits = 8 if top < 1 << 8 else 16 if top < 1 << 16 else 32
+    per_word = 64 // bits
+    n_words = -(-width // per_word)
+
+    # big-endian codes make each 8-byte group a word that compares like the codes
+    words = np.empty((n, n_words), dtype=np.uint64)
+    lo = 0
+    for part in parts:
+        padded = np.zeros((len(part), n_words * per_word), dtype=f'>u{bits // 8}')
+        padded[:, :part.shape[1]] = part
+        words[lo:lo + len(part)] = padded.view('>u8')
+        lo += len(part)
+
+    ranks = _dense_ranks(words[:, 0])
+    for j in range(1, n_words):
+        if n == 0 or ranks.max() == n - 1:
+            break  # already all distinct
+        following = _dense_ranks(words[:, j])
+        ranks = _dense_ranks(ranks * (int(following.max()) + 1) + following)
+    return ranks
+
+
+def _dense_ranks(values: np.ndarray) -> np.ndarray:
+    order = np.argsort(values)
+    ordered = values[order]
+    first = np.ones(len(values), dtype=bool)
+    first[1:] = ordered[1:] != ordered[:-1]
+    ranks = np.empty(len(values), dtype=np.int64)
+    ranks[order] = np.cumsum(first) - 1
+    return ranks
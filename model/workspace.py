@@ -0,0 +1,238 @@
+# model/workspace.py
+import queue
+import shutil
+import tempfile
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .report import TestReport
+from .snapshot import open_snapshot, write_snapshot
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+LOCK_FILE = ".lock"
+
+
+class Workspace:
+    """
+    Holds several open reports (one per tab). The most recently used reports
+    stay resident in memory; once their combined size exceeds the memory
+    budget, the least recently used inactive ones are spilled to an on-disk
+    snapshot and their DataFrames are released. Reopening the tab maps the
+    snapshot back in, so only the rows actually viewed are decoded.
+
+    Snapshots are written by a background thread, so a tab switch that
+    pushes the workspace over budget does not wait for the disk. If a write
+    fails, the report goes back to the resident set and `on_error` is
+    called with its name and the exception.
+    """
+    def __init__(self, cache_dir: Path, memory_budget: int,
+                 on_error: Optional[Callable[[str, BaseException], None]] = None):
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        remove_stale_workspaces(cache_dir)
+        # private spill directory so several running instances don't collide;
+        # the lock marks it as in use until this process exits
+        self.cache_dir = Path(tempfile.mkdtemp(prefix="workspace-", dir=cache_dir))
+        self._lock = open(self.cache_dir / LOCK_FILE, 'a+b')
+        _try_lock(self._lock)
+        self.memory_budget = memory_budget
+        self.on_error = on_error
+        self.active: Optional[str] = None
+
+        self._names: List[str] = []                          # tab order
+        self._resident: "OrderedDict[str, TestReport]" = OrderedDict()  # LRU order
+        self._spills: Dict[str, _Spill] = {}                 # spill snapshot per report
+        self._sizes: Dict[str, int] = {}
+        self._metadata: Dict[str, dict] = {}
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="workspace-spill")
+        self._failed: "queue.SimpleQueue[Tuple[str, _Spill]]" = queue.SimpleQueue()
+
+    def names(self) -> List[str]:
+        return list(self._names)
+
+    def add(self, name: str, report: TestReport, metadata: Optional[dict] = None) -> str:
+        """Registers a report under a unique tab name and returns that name."""
+        unique, n = name, 2
+        while unique in self._names:
+            unique = f"{name} ({n})"
+            n += 1
+        self._names.append(unique)
+        self._metadata[unique] = dict(metadata or {})
+        self._store(unique, report)
+        return unique
+
+    def activate(self, name: str) -> TestReport:
+        """Makes `name` the active report, loading it back from disk if it was spilled."""
+        self.active = name
+        report = self.get(name)
+        self._enforce_budget(keep=name)
+        return report
+
+    def get(self, name: str) -> TestReport:
+        if name in self._resident:
+            self._resident.move_to_end(name)
+            return self._resident[name]
+        spill = self._spills[name]
+        report = spill.report
+        if report is not None:
+            # not written yet (or the write failed): keep using the DataFrame
+            self._remove_file(name)
+            self._store(name, report, self._sizes[name])
+            return report
+        spill.future.result()
+        report = TestReport.from_snapshot(open_snapshot(spill.path))
+        report.sort_cache = spill.sort_cache   # the snapshot holds the same rows
+        self._store(name, report)
+        return report
+
+    def close(self, name: str) -> None:
+        self._drop(name)
+        self._names.remove(name)
+        self._metadata.pop(name, None)
+        if self.active == name:
+            self.active = None
+
+    def metadata(self, name: str) -> dict:
+        return dict(self._metadata.get(name, {}))
+
+    def set_metadata(self, name: str, metadata: dict) -> None:
+        if name in self._metadata:
+            self._metadata[name] = dict(metadata)
+
+    def memory_usage(self) -> int:
+        """Approximate bytes held by resident reports (not those still being written)."""
+        self._take_back_failed()
+        return sum(self._sizes[name] for name in self._resident)
+
+    def clear(self) -> None:
+        """Forgets all reports and removes the spill directory."""
+        wait([spill.future for spill in self._spills.values()])
+        self._names.clear()
+        self._resident.clear()
+        self._spills.clear()
+        self._sizes.clear()
+        self._metadata.clear()
+        self.active = None
+        self._lock.close()
+        # files still mapped on Windows survive this; the next start removes them
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    # ——— internals ——————————————————————————————————————————————————
+    def _store(self, name: str, report: TestReport, size: Optional[int] = None) -> None:
+        self._resident[name] = report
+        self._resident.move_to_end(name)
+        # measuring a large DataFrame takes a while, so a known size is reused
+        self._sizes[name] = report.memory_usage() if size is None else size
+        self._enforce_budget(keep=name)
+
+    def _drop(self, name: str) -> None:
+        self._resident.pop(name, None)
+        self._sizes.pop(name, None)
+        self._remove_file(name)
+
+    def _enforce_budget(self, keep: str) -> None:
+        # Walk from least to most recently used; never evict the active
+        # report or the one that was just touched. Snapshot-backed reports
+        # hold (almost) nothing in memory, so spilling them frees nothing.
+        for name in list(self._resident):
+            if self.memory_usage() <= self.memory_budget:
+                break
+            if name in (keep, self.active) or not self._sizes[name]:
+                continue
+            self._spill(name)
+
+    def _spill(self, name: str) -> None:
+        report = self._resident.pop(name)
+        self._remove_file(name)
+        spill = _Spill(self.cache_dir / f"{uuid.uuid4().hex}.snapshot", report)
+        spill.future = self._writer.submit(spill.write)
+        spill.future.add_done_callback(lambda future: self._written(name, spill, future))
+        self._spills[name] = spill
+
+    def _written(self, name: str, spill: "_Spill", future) -> None:
+        # runs on the writer thread: a failure is only queued, the report
+        # is taken back on the thread that owns the workspace
+        if future.exception() is not None:
+            self._failed.put((name, spill))
+
+    def _take_back_failed(self) -> None:
+        while True:
+            try:
+                name, spill = self._failed.get_nowait()
+            except queue.Empty:
+                return
+            if self._spills.get(name) is not spill:
+                continue  # closed or reopened since
+            del self._spills[name]
+            spill.remove()
+            # resident again, still the least recently used
+            self._resident[name] = spill.report
+            self._resident.move_to_end(name, last=False)
+            if self.on_error is not None:
+                self.on_error(name, spill.future.exception())
+
+    def _remove_file(self, name: str) -> None:
+        spill = self._spills.pop(name, None)
+        if spill is not None:
+            # a snapshot still being written is removed once the writer is done
+            spill.future.add_done_callback(lambda _: spill.remove())
+
+
+class _Spill:
+    """The on-disk snapshot of a spilled report."""
+    def __init__(self, path: Path, report: TestReport):
+        self.path = path
+        self.report: Optional[TestReport] = report   # held until the snapshot is complete
+        self.sort_cache = report.sort_cache
+        self.future = None
+
+    def write(self) -> None:
+        # runs on the writer thread
+        write_snapshot(self.path, self.report.frame, {})
+        self.report = None
+
+    def remove(self) -> None:
+        try:
+            self.path.unlink(missing_ok=True)
+        except OSError:
+            pass  # still mapped (Windows); removed with the cache directory
+
+
+def remove_stale_workspaces(cache_dir: Path) -> None:
+    """
+    Removes spill directories left behind by instances that are no longer
+    running (after a crash, or files that were still mapped on exit).
+    Directories whose lock is held by a live process are left alone.
+    """
+    if not cache_dir.is_dir():
+        return
+    for path in cache_dir.glob("workspace-*"):
+        if not path.is_dir():
+            continue
+        try:
+            with open(path / LOCK_FILE, 'a+b') as lock:
+                if not _try_lock(lock):
+                    continue  # in use
+        except OSError:
+            continue
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _try_lock(f) -> bool:
+    """Takes an exclusive, non-blocking lock on `f`; released when it is closed."""
+    try:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
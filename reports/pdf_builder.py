@@ -1,11 +1,15 @@
+import re
+from functools import partial
 from io import BytesIO
+from pathlib import Path
+from typing import Iterable, List
 from reportlab.lib.pagesizes import letter
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_LEFT, TA_CENTER
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Table, TableStyle,
-    Image as PDFImage, PageBreak, Spacer
+    Image as PDFImage, PageBreak, Spacer, KeepInFrame
 )
 from reportlab.lib.units import inch
 from model.report import TestStatus
@@ -13,7 +17,7 @@ from model.report import TestStatus
 from .pdf_config import (
     HEADER_FONT_SIZE, CELL_FONT_SIZE,
     TOTAL_LABEL_FONT_SIZE, TOTAL_VALUE_FONT_SIZE,
-    COL_WIDTHS
+    COL_WIDTHS, PREVIEW_TABLE_PAGES, PREVIEW_ROWS_PER_PAGE, STREAM_CHUNK_ROWS
 )
 
 # ——— Style Constants —————————————————————————————————————————————
@@ -49,7 +53,10 @@ def draw_footer(canvas, doc):
     canvas.saveState()
     canvas.setFont('Helvetica', 8)
     w, _ = letter
-    canvas.drawCentredString(w/2.0, 0.5*inch, f"Page {doc.page}")
+    label = f"Page {doc.page}"
+    if getattr(doc, 'volume', None):
+        label = f"Volume {doc.volume} - {label}"
+    canvas.drawCentredString(w/2.0, 0.5*inch, label)
     canvas.restoreState()
 
 def draw_header(canvas, doc):
@@ -88,18 +95,32 @@ def draw_header_and_footer(canvas, doc):
     draw_header(canvas, doc)
     draw_footer(canvas, doc)
 
-# ——— Main PDF Builder —————————————————————————————————————————————
-def build_pdf(path: str, df, metadata: dict, pie_bytes: bytes):
-    # Attach metadata for header/footer
-    SimpleDocTemplate.metadata = metadata
+def draw_draft_header_and_footer(canvas, doc):
+    # Same layout as the real header, without decoding the logo images
+    canvas.saveState()
+    canvas.setFont('Helvetica-Bold', 10)
+    canvas.setFillColor(colors.grey)
+    canvas.drawString(doc.leftMargin, letter[1] - doc.topMargin + 8, "DRAFT PREVIEW")
+    line_y = letter[1] - doc.topMargin
+    canvas.setStrokeColor(colors.grey)
+    canvas.setLineWidth(0.5)
+    canvas.line(doc.leftMargin, line_y, doc.leftMargin + doc.width, line_y)
+    canvas.restoreState()
+    draw_footer(canvas, doc)
 
-    doc = SimpleDocTemplate(
-        path,
-        pagesize=letter,
-        rightMargin=30, leftMargin=30,
-        topMargin=70, bottomMargin=40
-    )
+# ——— Report sections (shared by build_pdf and build_pdf_streaming) ————————
+DOC_MARGINS = dict(rightMargin=30, leftMargin=30, topMargin=70, bottomMargin=40)
+
+# heading of the test case table; everything before it is front matter
+CASES_HEADING = 'Test Cases'
+
+STATUS_COLORS = {
+    TestStatus.PASS.value: colors.limegreen,
+    TestStatus.FAIL.value: colors.tomato,
+    TestStatus.NOT_TESTED.value: colors.lightgrey,
+}
 
+def _report_styles():
     styles = getSampleStyleSheet()
     title_style = styles['Title']
     title_style.fontSize = 24
@@ -107,25 +128,39 @@ def build_pdf(path: str, df, metadata: dict, pie_bytes: bytes):
 
     heading_style = ParagraphStyle('Heading', parent=styles['Heading1'], fontSize=14, spaceAfter=12)
     normal_style = styles['Normal']
+    return title_style, heading_style, normal_style
 
+def _heading(text, style):
+    # _toc_label lets the streaming writer record which page a section starts on
+    para = Paragraph(text, style)
+    para._toc_label = para.getPlainText().rstrip(':')
+    return para
+
+def _cover_section(width, metadata: dict, styles, draft: bool):
+    title_style, _, normal_style = styles
     content = []
 
     # — Cover page —
-    logo1 = _get_image(metadata.get('logo_path', 'static/dummy.png'), 2.4 * inch, 0.5 * inch)
-    logo2 = _get_image(metadata.get('second_logo_path', 'static/dummy2.png'), 2.4 * inch, 0.5 * inch)
-
-    # Create a row with both logos
-    content.append(_styled_table(
-        [[logo1, logo2]],
-        [doc.width / 2, doc.width / 2],  # colWidths as second positional argument
-        [('ALIGN', (0, 0), (-1, -1), 'CENTER'), ('VALIGN', (0, 0), (-1, -1), 'MIDDLE')]
-    ))
-    content.append(Spacer(1, 50))
+    if draft:
+        # keep the space the logos and truck image take up so the layout matches
+        content.append(Spacer(1, 0.5 * inch + 50))
+        content.append(Spacer(1, 2.5 * inch + 50))
+    else:
+        logo1 = _get_image(metadata.get('logo_path', 'static/dummy.png'), 2.4 * inch, 0.5 * inch)
+        logo2 = _get_image(metadata.get('second_logo_path', 'static/dummy2.png'), 2.4 * inch, 0.5 * inch)
 
-    # Truck image
-    truck_image = _get_image(metadata.get('truck', 'static/car.jpg'), 5.5 * inch, 2.5 * inch)
-    content.append(truck_image)
-    content.append(Spacer(1, 50))
+        # Create a row with both logos
+        content.append(_styled_table(
+            [[logo1, logo2]],
+            [width / 2, width / 2],  # colWidths as second positional argument
+            [('ALIGN', (0, 0), (-1, -1), 'CENTER'), ('VALIGN', (0, 0), (-1, -1), 'MIDDLE')]
+        ))
+        content.append(Spacer(1, 50))
+
+        # Truck image
+        truck_image = _get_image(metadata.get('truck', 'static/car.jpg'), 5.5 * inch, 2.5 * inch)
+        content.append(truck_image)
+        content.append(Spacer(1, 50))
 
     # — Report metadata & summary —
     content.append(Paragraph('<b>Test Report</b>', title_style))
@@ -150,63 +185,120 @@ def build_pdf(path: str, df, metadata: dict, pie_bytes: bytes):
         ('TOPPADDING', (0,0), (-1,-1), 6),
         ('BOTTOMPADDING', (0,0), (-1,-1), 6),
     ]
-    content.append(_styled_table([[box_para]], [doc.width], box_style))
+    content.append(_styled_table([[box_para]], [width], box_style))
     main_info = [[label, metadata.get(key, '')] for key, label in meta_fields if metadata.get(key)]
     if main_info:
         content.append(_styled_table(main_info, [1.5*inch, 4*inch], BASE_TABLE_STYLE + HEADER_STYLE))
     content.append(PageBreak())
+    return content
+
+def _summary_section(total: int, metadata: dict, pie_bytes: bytes, styles, draft: bool):
+    _, heading_style, normal_style = styles
+    content = []
 
     summary = metadata.get('counts', {})
     if summary:
-        sum_data = [['Total', len(df)]] + [[label, summary.get(key, 0)] for key, label in [
+        sum_data = [['Total', total]] + [[label, summary.get(key, 0)] for key, label in [
             (TestStatus.PASS.value, 'Pass'), (TestStatus.FAIL.value, 'Fail'), (TestStatus.NOT_TESTED.value, 'Not Tested')
         ]]
-        content.append(Paragraph('Summary:', heading_style))
+        content.append(_heading('Summary:', heading_style))
         content.append(_styled_table(sum_data, [1.5*inch, 4*inch], BASE_TABLE_STYLE + HEADER_STYLE))
     content.append(Spacer(1, 100))
 
     if pie_bytes:
         pie = _get_image(BytesIO(pie_bytes), 4*inch, 4*inch)
         content.append(pie)
+    elif draft:
+        content.append(Paragraph('<i>Pie chart omitted in draft preview.</i>', normal_style))
 
     content.append(PageBreak())
+    return content
 
-    # — Test Cases Table —
-    content.append(PageBreak())
-    content.append(Paragraph('<b>Test Cases</b>', heading_style))
+def _header_row():
     col_titles = ['Test Case ID', 'Test Case Description', 'Test Status', 'Comments']
-    header = [Paragraph(f'<b>{t}</b>', ParagraphStyle('hdr', alignment=TA_CENTER, fontSize=HEADER_FONT_SIZE)) for t in col_titles]
-    data = [header]
+    return [Paragraph(f'<b>{t}</b>', ParagraphStyle('hdr', alignment=TA_CENTER, fontSize=HEADER_FONT_SIZE)) for t in col_titles]
+
+def _total_row(total: int):
+    return [
+        Paragraph('<b>Total Cases</b>', ParagraphStyle('total_lbl', alignment=TA_LEFT, fontSize=TOTAL_LABEL_FONT_SIZE)),
+        Paragraph(f'<b>{total}</b>', ParagraphStyle('total_val', alignment=TA_LEFT, fontSize=TOTAL_VALUE_FONT_SIZE)),
+        '', ''
+    ]
+
+class _CaseIdParagraph(Paragraph):
+    """Test Case ID cell that reports (test case index, ID) to `on_draw` once drawn."""
+    def __init__(self, text, style, index=None, on_draw=None, **kwargs):
+        super().__init__(text, style, **kwargs)
+        self.index = index
+        self.on_draw = on_draw
+
+    def draw(self):
+        super().draw()
+        if self.on_draw is not None:
+            self.on_draw(self.index, self.getPlainText())
 
-    # Populate rows
-    for record in df.itertuples(index=False):
-        aligns = [TA_CENTER, TA_LEFT, TA_CENTER, TA_LEFT]
+def _case_rows(rows, first_row: int, first_index: int = 0, on_draw=None):
+    """
+    Paragraph cells plus status background commands for `rows`, whose first
+    record lands at table row `first_row` and is test case `first_index`.
+    With `on_draw`, each ID cell reports itself through it when drawn.
+    """
+    data, status_styles = [], []
+    aligns = [TA_CENTER, TA_LEFT, TA_CENTER, TA_LEFT]
+    for i, record in enumerate(rows.itertuples(index=False)):
         row_cells = [Paragraph(str(val), ParagraphStyle('cell', alignment=align, fontSize=CELL_FONT_SIZE))
                      for val, align in zip(record, aligns)]
+        if on_draw is not None:
+            row_cells[0] = _CaseIdParagraph(str(record[0]), row_cells[0].style, first_index + i, on_draw)
         data.append(row_cells)
 
-    # Add total row
-    total_row = [
-        Paragraph('<b>Total Cases</b>', ParagraphStyle('total_lbl', alignment=TA_LEFT, fontSize=TOTAL_LABEL_FONT_SIZE)),
-        Paragraph(f'<b>{len(df)}</b>', ParagraphStyle('total_val', alignment=TA_LEFT, fontSize=TOTAL_VALUE_FONT_SIZE)),
-        '', ''
-    ]
-    data.append(total_row)
-
-    # — Color the Test Status column per status —
-    status_colors = {
-        TestStatus.PASS.value: colors.limegreen,
-        TestStatus.FAIL.value: colors.tomato,
-        TestStatus.NOT_TESTED.value: colors.lightgrey,
-    }
-    status_styles = []
-    # start=1 to skip header row
-    for i, record in enumerate(df.itertuples(index=False), start=1):
-        status_val = str(record[2])
-        color = status_colors.get(status_val)
+        # — Color the Test Status column per status —
+        color = STATUS_COLORS.get(str(record[2]))
         if color:
             # Column index 2 corresponds to "Test Status"
-            status_styles.append(('BACKGROUND', (2, i), (2, i), color))
+            status_styles.append(('BACKGROUND', (2, first_row + i), (2, first_row + i), color))
+    return data, status_styles
+
+def _row_slice(df, start: int, stop: int):
+    # SnapshotFrame decodes just the requested rows
+    return df.iloc[start:stop] if hasattr(df, 'iloc') else df.rows(start, stop)
+
+# ——— Main PDF Builder —————————————————————————————————————————————
+def build_pdf_preview(df, metadata: dict, pages: int = PREVIEW_TABLE_PAGES) -> bytes:
+    """
+    Builds a draft of the report in memory and returns the PDF bytes.
+    `df` may also be a SnapshotFrame; only its first rows are decoded.
+    Logos, cover image and pie chart are left out and only about `pages`
+    pages of the test case table are laid out, so the cost does not grow
+    with the size of the report.
+    """
+    buf = BytesIO()
+    build_pdf(buf, df, metadata, None, draft=True,
+              max_rows=pages * PREVIEW_ROWS_PER_PAGE)
+    return buf.getvalue()
+
+def build_pdf(path, df, metadata: dict, pie_bytes: bytes, draft: bool = False, max_rows=None):
+    # `path` may also be a file-like object (used for in-memory previews).
+    # draft=True skips all images; max_rows limits the test case table.
+    # Attach metadata for header/footer
+    SimpleDocTemplate.metadata = metadata
+
+    doc = SimpleDocTemplate(path, pagesize=letter, **DOC_MARGINS)
+
+    styles = _report_styles()
+    _, heading_style, normal_style = styles
+
+    content = _cover_section(doc.width, metadata, styles, draft)
+    content += _summary_section(len(df), metadata, pie_bytes, styles, draft)
+
+    # — Test Cases Table —
+    content.append(PageBreak())
+    content.append(_heading(f'<b>{CASES_HEADING}</b>', heading_style))
+    rows = df if max_rows is None else _row_slice(df, 0, max_rows)
+
+    # start=1 to skip header row
+    case_rows, status_styles = _case_rows(rows, first_row=1)
+    data = [_header_row()] + case_rows + [_total_row(len(df))]
 
     # Build and append the styled table
     content.append(
@@ -219,5 +311,232 @@ def build_pdf(path: str, df, metadata: dict, pie_bytes: bytes):
         )
     )
 
+    if len(rows) < len(df):
+        content.append(Spacer(1, 12))
+        content.append(Paragraph(
+            f'<i>{len(df) - len(rows)} more test cases not shown in draft preview.</i>',
+            normal_style))
+
     # Build PDF
-    doc.build(content, onFirstPage=draw_footer, onLaterPages=draw_header_and_footer)
+    later_pages = draw_draft_header_and_footer if draft else draw_header_and_footer
+    doc.build(content, onFirstPage=draw_footer, onLaterPages=later_pages)
+
+# ——— Streaming PDF Builder ————————————————————————————————————————
+class _VolumeDocTemplate(SimpleDocTemplate):
+    """
+    Document for one output file of the streaming writer. ReportLab lays
+    out the story list in place, so the list is topped up from `feed` after
+    every flowable; once `max_pages` pages are full it is emptied, which
+    ends the build, and what was left is kept in `carry` for the next
+    volume. Also records where headings ended up, for the table of contents.
+    """
+    def __init__(self, filename, metadata: dict, feed: '_StoryFeed', volume=None, max_pages=None):
+        super().__init__(filename, pagesize=letter, pageCompression=1, **DOC_MARGINS)
+        self.metadata = metadata
+        self.feed = feed
+        self.volume = volume
+        self.max_pages = max_pages
+        self.full = False
+        self.story = []
+        self.carry = []
+        self.headings = []          # (label, page)
+        self.cases = None           # [(index, id), (index, id)] first/last test case drawn
+
+    def build_volume(self, story: list, **kwargs):
+        self.story = story
+        self.feed.doc = self
+        self.feed.top_up(story)
+        self.build(story, **kwargs)
+
+    def afterPage(self):
+        if self.max_pages and self.page >= self.max_pages and not self.full:
+            self.full = True
+            self.carry = self.story[:]
+            del self.story[:]
+
+    def afterFlowable(self, flowable):
+        label = getattr(flowable, '_toc_label', None)
+        if label:
+            self.headings.append((label, self.page))
+        if not self.full:
+            self.feed.top_up(self.story)
+
+    def record_case(self, index: int, case_id: str):
+        self.cases = [self.cases[0] if self.cases else (index, case_id), (index, case_id)]
+
+class _StoryFeed:
+    """
+    Pulls the streaming story from its generator only as layout reaches
+    it. `make_story(on_draw)` builds the generator; its test case ID cells
+    report to the volume being laid out when they are drawn.
+    """
+    # flowables handed to ReportLab ahead of layout; enough for keepWithNext
+    LOOKAHEAD = 2
+
+    def __init__(self, make_story):
+        self.doc = None
+        self._source = iter(make_story(self._record_case))
+
+    def top_up(self, story: list):
+        while len(story) < self.LOOKAHEAD:
+            try:
+                story.append(next(self._source))
+            except StopIteration:
+                break
+
+    def _record_case(self, index: int, case_id: str):
+        self.doc.record_case(index, case_id)
+
+def _streaming_story(width, df, metadata: dict, pie_bytes: bytes, toc=None, on_draw=None):
+    styles = _report_styles()
+    _, heading_style, _ = styles
+    total = len(df)
+
+    yield from _cover_section(width, metadata, styles, draft=False)
+    if toc is not None:
+        yield toc
+        yield PageBreak()
+    yield from _summary_section(total, metadata, pie_bytes, styles, draft=False)
+
+    # — Test Cases Table, one small table per chunk of rows —
+    yield PageBreak()
+    yield _heading(f'<b>{CASES_HEADING}</b>', heading_style)
+    for start in range(0, max(total, 1), STREAM_CHUNK_ROWS):
+        stop = min(start + STREAM_CHUNK_ROWS, total)
+        first, last = start == 0, stop == total
+        case_rows, style_cmds = _case_rows(_row_slice(df, start, stop), first_row=int(first),
+                                           first_index=start, on_draw=on_draw)
+        data = ([_header_row()] if first else []) + case_rows + ([_total_row(total)] if last else [])
+        style_cmds += BASE_TABLE_STYLE + [('LEFTPADDING', (0, int(first)), (0, -1), 6)]
+        if first:
+            style_cmds += HEADER_STYLE
+        if last:
+            style_cmds += TOTAL_ROW_STYLE
+        yield _styled_table(data, COL_WIDTHS, style_cmds)
+
+def _toc_section(volumes, styles):
+    """One-page table of contents listing where each section and volume's test cases are."""
+    _, heading_style, normal_style = styles
+    cell = ParagraphStyle('toc', parent=normal_style, fontSize=CELL_FONT_SIZE)
+    data = [[Paragraph('<b>Section</b>', cell), Paragraph('<b>Location</b>', cell)]]
+    for n, vol in enumerate(volumes, start=1):
+        for label, page in vol['headings']:
+            data.append([Paragraph(label, cell), Paragraph(f"Volume {n}, page {page}", cell)])
+    for n, vol in enumerate(volumes, start=1):
+        cases = '—'
+        if vol['cases']:
+            (i, first_id), (j, last_id) = vol['cases']
+            cases = f"Test cases {i + 1}–{j + 1} ({first_id} – {last_id})"
+        data.append([Paragraph(f"Volume {n}: {vol['file']}", cell),
+                     Paragraph(f"{vol['pages']} pages. {cases}", cell)])
+    content = [
+        Paragraph('<b>Table of Contents</b>', heading_style),
+        _styled_table(data, [2.5*inch, 4.25*inch], BASE_TABLE_STYLE + HEADER_STYLE),
+    ]
+    # shrink rather than overflow so the page count (and every later page) stays put
+    width = letter[0] - DOC_MARGINS['leftMargin'] - DOC_MARGINS['rightMargin']
+    height = letter[1] - DOC_MARGINS['topMargin'] - DOC_MARGINS['bottomMargin']
+    return KeepInFrame(width, height, content, mode='shrink')
+
+def build_pdf_streaming(path: str, df, metadata: dict, pie_bytes: bytes,
+                        pages_per_volume=None) -> List[str]:
+    """
+    Writes the report without ever holding the whole story in memory: the
+    test case table is generated in chunks of STREAM_CHUNK_ROWS rows from
+    `df` (a DataFrame or SnapshotFrame) as layout reaches them.
+
+    With `pages_per_volume`, output is split into `<name>_vol1.pdf`,
+    `<name>_vol2.pdf`, ... of at most that many pages; the first volume
+    holds the cover, a table of contents and the summary, so a smaller
+    `pages_per_volume` is rejected with ValueError. A report that fits in
+    one volume is written to `path` as a single file, without volume
+    numbers or a table of contents. ReportLab still
+    keeps each finished (compressed) page of the current file until it is
+    saved, so splitting is what bounds memory for the very largest reports.
+    Volume files left next to `path` by an earlier, longer export are
+    removed. Returns the paths written.
+    """
+    width = letter[0] - DOC_MARGINS['leftMargin'] - DOC_MARGINS['rightMargin']
+    if not pages_per_volume:
+        return _build_single_volume(path, width, df, metadata, pie_bytes, None)
+
+    base = Path(path)
+    # reserve one page for the table of contents; it is filled in afterwards
+    feed = _StoryFeed(partial(_streaming_story, width, df, metadata, pie_bytes, Spacer(1, 1)))
+    volumes, paths, story, pages = [], [], [], 0
+    while True:
+        feed.top_up(story)
+        if volumes and not story:
+            break
+        n = len(volumes) + 1
+        vol_path = str(base.with_name(f"{base.stem}_vol{n}{base.suffix}"))
+        doc = _VolumeDocTemplate(vol_path, metadata, feed, volume=n, max_pages=pages_per_volume)
+        doc.build_volume(story, onFirstPage=draw_footer if n == 1 else draw_header_and_footer,
+                         onLaterPages=draw_header_and_footer)
+        story = doc.carry
+        volumes.append({'file': Path(vol_path).name, 'pages': doc.page,
+                        'headings': doc.headings, 'cases': doc.cases})
+        paths.append(vol_path)
+        for label, page in doc.headings:
+            if label == CASES_HEADING and pages + page - 1 > pages_per_volume:
+                for written in paths:
+                    Path(written).unlink(missing_ok=True)
+                raise ValueError(f"Volumes of {pages_per_volume} pages cannot hold the cover, "
+                                 f"contents and summary ({pages + page - 1} pages)")
+        pages += doc.page
+    _check_volumes(volumes, len(df), pages_per_volume)
+
+    if len(paths) == 1:
+        # everything fits into one volume: a plain report under the requested name
+        Path(paths[0]).unlink()
+        return _build_single_volume(path, width, df, metadata, pie_bytes, pages_per_volume)
+
+    # Lay the first volume out again with the real contents page. It takes
+    # up exactly the reserved page, so the volume ends at the same point.
+    toc = _toc_section(volumes, _report_styles())
+    feed = _StoryFeed(partial(_streaming_story, width, df, metadata, pie_bytes, toc))
+    doc = _VolumeDocTemplate(paths[0], metadata, feed, volume=1, max_pages=pages_per_volume)
+    doc.build_volume([], onFirstPage=draw_footer, onLaterPages=draw_header_and_footer)
+    if (doc.page, doc.cases) != (volumes[0]['pages'], volumes[0]['cases']):
+        raise RuntimeError("The table of contents changed the layout of the first volume")
+    remove_stale_volumes(path, paths)
+    return paths
+
+def _build_single_volume(path: str, width, df, metadata: dict, pie_bytes: bytes,
+                         pages_per_volume) -> List[str]:
+    feed = _StoryFeed(partial(_streaming_story, width, df, metadata, pie_bytes, None))
+    doc = _VolumeDocTemplate(path, metadata, feed)
+    doc.build_volume([], onFirstPage=draw_footer, onLaterPages=draw_header_and_footer)
+    _check_volumes([{'pages': doc.page, 'cases': doc.cases}], len(df), pages_per_volume)
+    remove_stale_volumes(path, [path])
+    return [path]
+
+def _check_volumes(volumes, total: int, pages_per_volume):
+    """
+    Guards against a ReportLab release that lays out the story differently
+    from what the streaming writer relies on: every volume within its page
+    limit, and the test cases covered once each, in order.
+    """
+    expected = 0
+    for n, vol in enumerate(volumes, start=1):
+        if pages_per_volume and vol['pages'] > pages_per_volume:
+            raise RuntimeError(f"Volume {n} has {vol['pages']} pages, more than {pages_per_volume}")
+        if vol['cases']:
+            (first, _), (last, _) = vol['cases']
+            if first != expected:
+                raise RuntimeError(f"Volume {n} starts at test case {first + 1}, expected {expected + 1}")
+            expected = last + 1
+    if expected != total:
+        raise RuntimeError(f"Only {expected} of {total} test cases were written")
+
+def remove_stale_volumes(path: str, keep: Iterable[str]) -> None:
+    """
+    Deletes `<name>_volN.pdf` files next to `path` that are not in `keep`,
+    i.e. volumes left over from an earlier export to the same name.
+    """
+    base = Path(path)
+    pattern = re.compile(re.escape(base.stem) + r'_vol\d+' + re.escape(base.suffix), re.IGNORECASE)
+    keep = {Path(p).resolve() for p in keep}
+    for candidate in base.parent.iterdir():
+        if pattern.fullmatch(candidate.name) and candidate.resolve() not in keep:
+            candidate.unlink(missing_ok=True)
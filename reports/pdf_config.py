@@ -19,3 +19,15 @@ COL_WIDTHS = [
     0.75 * inch,
     1.5 * inch,
 ]
+
+# Draft preview: number of test case table pages laid out, and the
+# approximate number of single-line rows that fit on one of them
+PREVIEW_TABLE_PAGES   = 2
+PREVIEW_ROWS_PER_PAGE = 35
+
+# Streaming writer: test case rows per generated table chunk, the row
+# count from which the app switches to it, and pages per volume file
+# (None writes a single file)
+STREAM_CHUNK_ROWS     = 50
+STREAMING_MIN_ROWS    = 10000
+VOLUME_MAX_PAGES      = 500
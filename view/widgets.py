@@ -3,12 +3,20 @@
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QTableView, QPushButton, QLineEdit, QDateEdit,
     QCheckBox, QLabel, QHBoxLayout, QVBoxLayout, QFormLayout,
-    QMessageBox, QStyledItemDelegate, QComboBox, QHeaderView
+    QMessageBox, QStyledItemDelegate, QComboBox, QHeaderView, QTabBar, QDialog
+)
+from PySide6.QtCore import (
+    Qt, QDate, QAbstractTableModel, QModelIndex, QBuffer, QByteArray, QIODevice
 )
-from PySide6.QtCore import Qt, QDate, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QAction
+from PySide6.QtPdf import QPdfDocument
+from PySide6.QtPdfWidgets import QPdfView
 
 from model.report import TestStatus
+from model.sorting import NATURAL_SORT_COLUMNS, SortCache, is_distinct, sort_key, sort_permutation
+
+import numpy as np
+import pandas as pd
 
 import yaml
 from pathlib import Path
@@ -41,16 +49,99 @@ class StatusDelegate(QStyledItemDelegate):
 
 
 class PandasTableModel(QAbstractTableModel):
+    """
+    Table model over a DataFrame (or a memory-mapped SnapshotFrame, which
+    decodes only the cells that are shown). Sorting and status filtering
+    never move data: the model keeps `_rows`, the frame row shown at each
+    view row (None while the frame is shown unsorted and unfiltered).
+    """
+    # sort keys kept (clicked column first) for multi-column ordering
+    MAX_SORT_COLUMNS = 3
+
     def __init__(self, df=None):
         super().__init__()
         self._df = df
+        self._rows = None
+        self._sort_spec = []      # [(column, ascending), ...] primary first
+        self._filter = None       # (column, allowed display values) or None
+        self._cache = SortCache()  # the report's, so it survives tab switches
 
-    def set_dataframe(self, df):
+    def set_dataframe(self, df, sort_cache=None):
         self.beginResetModel()
         self._df = df
+        self._sort_spec = []
+        self._cache = sort_cache if sort_cache is not None else SortCache()
+        self._rows = self._visible_rows()
+        self.endResetModel()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        if self._df is None:
+            return
+        if column < 0:
+            self._sort_spec = []
+        else:
+            ascending = order == Qt.AscendingOrder
+            self._sort_spec = ([(column, ascending)] +
+                               [s for s in self._sort_spec if s[0] != column])
+            del self._sort_spec[self.MAX_SORT_COLUMNS:]
+        self.beginResetModel()
+        self._rows = self._visible_rows()
+        self.endResetModel()
+
+    def set_filter(self, column, values):
+        """Shows only rows whose `column` displays one of `values` (None shows all)."""
+        self.beginResetModel()
+        self._filter = None if column is None else (column, set(values))
+        self._rows = self._visible_rows()
         self.endResetModel()
 
+    def source_row(self, row):
+        return row if self._rows is None else int(self._rows[row])
+
+    def _visible_rows(self):
+        if self._df is None:
+            return None
+        # Start from the cached order of the least significant column and
+        # re-sort it by each more significant one; a column without ties
+        # decides the order alone, so its cached order is used as is.
+        order = None
+        for column, ascending in reversed(self._sort_spec):
+            if order is None or is_distinct(self._sort_key(column)):
+                order = self._permutation(column, ascending)
+            else:
+                order = sort_permutation(self._sort_key(column), ascending, order)
+        if self._filter is None:
+            return order
+        column, values = self._filter
+        mask = self._column(column).astype(str).isin(values).to_numpy()
+        return np.flatnonzero(mask) if order is None else order[mask[order]]
+
+    def _sort_key(self, column):
+        keys = self._cache.keys
+        if column not in keys:
+            natural = self._df.columns[column] in NATURAL_SORT_COLUMNS
+            if natural and not isinstance(self._df, pd.DataFrame):
+                # a snapshot ranks its stored text without decoding it
+                keys[column] = self._df.natural_sort_key(column)
+            else:
+                keys[column] = sort_key(self._column(column), natural)
+        return keys[column]
+
+    def _permutation(self, column, ascending):
+        # at most two per column
+        orders = self._cache.orders
+        if (column, ascending) not in orders:
+            orders[(column, ascending)] = sort_permutation(self._sort_key(column), ascending)
+        return orders[(column, ascending)]
+
+    def _column(self, column):
+        if isinstance(self._df, pd.DataFrame):
+            return self._df.iloc[:, column]
+        return self._df.column(column)
+
     def rowCount(self, parent: QModelIndex = QModelIndex()):
+        if self._rows is not None:
+            return len(self._rows)
         return 0 if self._df is None else self._df.shape[0]
 
     def columnCount(self, parent: QModelIndex = QModelIndex()):
@@ -59,14 +150,14 @@ class PandasTableModel(QAbstractTableModel):
     def data(self, index, role=Qt.DisplayRole):
         if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
             return None
-        return str(self._df.iat[index.row(), index.column()])
+        return str(self._df.iat[self.source_row(index.row()), index.column()])
 
     def headerData(self, section, orientation, role=Qt.DisplayRole):
         if role != Qt.DisplayRole:
             return None
         if orientation == Qt.Horizontal:
             return self._df.columns[section]
-        return str(section)
+        return str(self.source_row(section))
 
     def flags(self, index):
         if not index.isValid():
@@ -75,17 +166,45 @@ class PandasTableModel(QAbstractTableModel):
 
     def setData(self, index, value, role=Qt.EditRole):
         if index.isValid() and role == Qt.EditRole:
-            self._df.iat[index.row(), index.column()] = value
+            column = index.column()
+            self._df.iat[self.source_row(index.row()), column] = value
+            # only the edited column's key and orders become stale
+            self._cache.invalidate(column)
             self.dataChanged.emit(index, index, [Qt.DisplayRole])
             return True
         return False
 
 
+class PdfPreviewDialog(QDialog):
+    """Shows an in-memory PDF; QPdfView only renders the pages scrolled into view."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(cfg['preview']['title'])
+        self.resize(*cfg['preview']['size'])
+        self._buffer = None
+        self._document = QPdfDocument(self)
+        self._view = QPdfView(self)
+        self._view.setPageMode(QPdfView.PageMode.MultiPage)
+        self._view.setZoomMode(QPdfView.ZoomMode.FitToWidth)
+        self._view.setDocument(self._document)
+        layout = QVBoxLayout(self)
+        layout.addWidget(self._view)
+
+    def set_pdf(self, pdf_bytes: bytes):
+        self._document.close()
+        # the buffer must outlive the document that reads from it
+        self._buffer = QBuffer(self)
+        self._buffer.setData(QByteArray(pdf_bytes))
+        self._buffer.open(QIODevice.ReadOnly)
+        self._document.load(self._buffer)
+
+
 class MainWindow(QMainWindow):
     def __init__(self, controller):
         super().__init__()
         self.controller = controller
         self.status_col = None
+        self.preview = None
         self.setWindowTitle("Test Report Generator")
         self.setGeometry(100, 100, 1000, 700)
         self._build_ui()
@@ -156,10 +275,19 @@ class MainWindow(QMainWindow):
             filter_layout.addWidget(cb)
         main_layout.addLayout(filter_layout)
 
+        # --- Report tabs (one per open report) ---
+        self.tabs = QTabBar()
+        self.tabs.setTabsClosable(True)
+        self.tabs.setExpanding(False)
+        self.tabs.currentChanged.connect(self.controller.switch_report)
+        self.tabs.tabCloseRequested.connect(self.controller.close_report)
+        main_layout.addWidget(self.tabs)
+
         # --- Table view ---
         self.table = QTableView()
         self.model = PandasTableModel()
         self.table.setModel(self.model)
+        self.table.setSortingEnabled(True)
         self._resize_columns()
         main_layout.addWidget(self.table)
 
@@ -168,6 +296,9 @@ class MainWindow(QMainWindow):
         self.gen_pdf_btn = QPushButton(cfg['buttons']['generate_pdf'])
         self.gen_pdf_btn.clicked.connect(self.controller.generate_pdf)
         btn_layout.addWidget(self.gen_pdf_btn)
+        self.preview_pdf_btn = QPushButton(cfg['buttons']['preview_pdf'])
+        self.preview_pdf_btn.clicked.connect(self.controller.preview_pdf)
+        btn_layout.addWidget(self.preview_pdf_btn)
         main_layout.addLayout(btn_layout)
 
         # --- Feedback ---
@@ -200,20 +331,21 @@ class MainWindow(QMainWindow):
 
     def apply_filters(self):
         if self.status_col is None:
+            self.model.set_filter(None, None)
             return
-        for row in range(self.model.rowCount()):
-            idx = self.model.index(row, self.status_col)
-            status = idx.data()
-            visible = (
-                (status == TestStatus.PASS.value and self.filter_pass.isChecked()) or
-                (status == TestStatus.FAIL.value and self.filter_fail.isChecked()) or
-                (status == TestStatus.NOT_TESTED.value and self.filter_not.isChecked())
-            )
-            self.table.setRowHidden(row, not visible)
-
-    def update_view(self, df, summary):
-        # load new data into the model
-        self.model.set_dataframe(df)
+        checks = (
+            (TestStatus.PASS.value, self.filter_pass),
+            (TestStatus.FAIL.value, self.filter_fail),
+            (TestStatus.NOT_TESTED.value, self.filter_not),
+        )
+        # filtering happens inside the model so it composes with sorting
+        self.model.set_filter(self.status_col,
+                              [status for status, cb in checks if cb.isChecked()])
+
+    def update_view(self, df, summary, sort_cache=None):
+        # load new data into the model; it starts out in file order
+        self.model.set_dataframe(df, sort_cache)
+        self.table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
         # find status column index
         try:
             self.status_col = df.columns.get_loc("Test Status")
@@ -235,6 +367,21 @@ class MainWindow(QMainWindow):
         # force redraw
         self.table.reset()
 
+    def add_tab(self, name: str):
+        # selecting the new tab lets the controller switch to it via currentChanged
+        index = self.tabs.addTab(name)
+        self.tabs.setCurrentIndex(index)
+
+    def remove_tab(self, index: int):
+        self.tabs.removeTab(index)
+
+    def show_pdf_preview(self, pdf_bytes: bytes):
+        if self.preview is None:
+            self.preview = PdfPreviewDialog(self)
+        self.preview.set_pdf(pdf_bytes)
+        self.preview.show()
+        self.preview.raise_()
+
     def show_error(self, message: str):
         QMessageBox.critical(self, "Error", message)
 
@@ -253,6 +400,8 @@ class MainWindow(QMainWindow):
         self.tester_input.setText(metadata.get('tester', ''))
         if metadata.get('date'):
             self.date_input.setDate(QDate.fromString(metadata['date'], "yyyy-MM-dd"))
+        elif cfg['date']['default_to_today']:
+            self.date_input.setDate(QDate.currentDate())
         self.software_version_input.setText(metadata.get('version', ''))
         self.hardware_version_input.setText(metadata.get('hardware_version', ''))
         self.arxml_input.setText(metadata.get('arxml_version', ''))